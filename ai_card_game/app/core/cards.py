@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List
 import random
 
@@ -6,30 +6,26 @@ import random
 SUITS = ["hearts", "diamonds", "clubs", "spades"]
 RANKS = ["A", "2", "3", "4", "5", "6", "7", "8", "9", "10", "J", "Q", "K"]
 
+_SUIT_MAP = {"hearts": "H", "diamonds": "D", "clubs": "C", "spades": "S"}
+_FACE_MAP = {"A": "ace", "J": "jack", "Q": "queen", "K": "king"}
+
 
 @dataclass(frozen=True)
 class Card:
     suit: str  # e.g. "hearts"
     rank: str  # e.g. "A", "10", "K"
 
-    @property
-    def id(self) -> str:
-        """Stable id like 'H_A' (H=hearts, D=diamonds, C=clubs, S=spades)."""
-        suit_map = {"hearts": "H", "diamonds": "D", "clubs": "C", "spades": "S"}
-        return f"{suit_map[self.suit]}_{self.rank}"
-
-    @property
-    def svg_filename(self) -> str:
-        """Filename we expect in assets/cards.
-
-        For numbered cards this is '<suit>_<rank>.svg', e.g. 'clubs_2.svg'.
-        For A and face cards we map to full names: A -> ace, J -> jack,
-        Q -> queen, K -> king, e.g. 'spades_ace.svg', 'diamonds_king.svg',
-        'hearts_queen.svg'.
-        """
-        face_map = {"A": "ace", "J": "jack", "Q": "queen", "K": "king"}
-        rank_part = face_map.get(self.rank, self.rank)
-        return f"{self.suit}_{rank_part}.svg"
+    # Derived once in __post_init__; the UI reads these on every refresh.
+    # id is stable like 'H_A' (H=hearts, D=diamonds, C=clubs, S=spades).
+    id: str = field(init=False, repr=False, compare=False)
+    # Filename we expect in assets/cards: '<suit>_<rank>.svg' for numbered
+    # cards ('clubs_2.svg'), full names for A and faces ('spades_ace.svg').
+    svg_filename: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "id", f"{_SUIT_MAP[self.suit]}_{self.rank}")
+        rank_part = _FACE_MAP.get(self.rank, self.rank)
+        object.__setattr__(self, "svg_filename", f"{self.suit}_{rank_part}.svg")
 
 
 class Deck:
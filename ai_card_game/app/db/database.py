@@ -72,7 +72,6 @@ def get_statistics() -> dict:
         "losses": 0,
         "pushes": 0,
         "win_rate": 0.0,
-        "recent_games": []
     }
     
     # Total counts
@@ -91,14 +90,21 @@ def get_statistics() -> dict:
     if stats["total_games"] > 0:
         stats["win_rate"] = (stats["wins"] / stats["total_games"]) * 100
     
-    # Recent games (last 10)
+    conn.close()
+    return stats
+
+
+def get_recent_games(limit: int = 10, offset: int = 0) -> list[dict]:
+    """Get one page of game history, newest first."""
+    conn = get_connection()
+    cur = conn.cursor()
     cur.execute(
         """
         SELECT created_at, game_type, result, player_final_score, ai_final_score
-        FROM game_stats ORDER BY id DESC LIMIT 10
-        """
+        FROM game_stats ORDER BY id DESC LIMIT ? OFFSET ?
+        """,
+        (limit, offset)
     )
-    stats["recent_games"] = [dict(row) for row in cur.fetchall()]
-    
+    games = [dict(row) for row in cur.fetchall()]
     conn.close()
-    return stats
+    return games
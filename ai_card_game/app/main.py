@@ -2,6 +2,7 @@ import sys
 from PySide6.QtWidgets import QApplication
 
 from .ui.main_window import MainWindow
+from .ui.asset_cache import preload_card_assets, stop_preload
 from .db.database import init_db
 
 
@@ -11,9 +12,16 @@ def main() -> None:
     init_db()
 
     app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec())
+    # Render card artwork in the background while the window comes up
+    preload_card_assets()
+    try:
+        window = MainWindow()
+        window.show()
+        exit_code = app.exec()
+    finally:
+        # Preload workers must not outlive the QApplication
+        stop_preload()
+    sys.exit(exit_code)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,253 @@
+"""Shared rasterized card artwork.
+
+SVG assets are rendered once into QPixmaps and kept in Qt's process-wide
+QPixmapCache, so every view and dialog showing the same artwork at the
+same size reuses a single pixmap.
+"""
+
+import threading
+from pathlib import Path
+
+from PySide6.QtCore import (
+    QByteArray, QCoreApplication, QFileSystemWatcher, QRectF, QRunnable, QThreadPool, Qt,
+)
+from PySide6.QtGui import QGuiApplication, QImage, QPainter, QPixmap, QPixmapCache
+from PySide6.QtSvg import QSvgRenderer
+
+ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
+CARDS_DIR = ASSETS_DIR / "cards"
+BACKS_DIR = ASSETS_DIR / "backs"
+
+# Cache limit is in KB
+QPixmapCache.setCacheLimit(20 * 1024)
+
+# Parsed SVGs shared by every GUI-thread rasterization of the same file
+_RENDERER_CACHE: dict[Path, QSvgRenderer] = {}
+
+# Card faces rendered once per (filename, width, height, device pixel ratio);
+# at most 52 per size
+_PIXMAP_CACHE: dict[tuple[str, int, int, float], QPixmap] = {}
+
+# Sizes the views request: Poker cards and backs, War cards and piles,
+# and the back preview in Game Settings
+CARD_SIZES = ((80, 112), (100, 140))
+BACK_SIZES = CARD_SIZES + ((120, 168),)
+
+# Images rendered ahead of time by preload_card_assets() worker threads.
+# QPixmap may only be created on the GUI thread, so workers produce QImages
+# and _rasterize() converts them on first use.
+_IMAGE_CACHE: dict[tuple[Path, int, int, float], QImage] = {}
+# Keys _rasterize() has already handled; a worker finishing after that
+# drops its image instead of leaving it in _IMAGE_CACHE for good
+_RASTERIZED_KEYS: set[tuple[Path, int, int, float]] = set()
+_IMAGE_LOCK = threading.Lock()
+_preload_started = False
+
+# Available back filenames; None until scanned or after the folder changes
+_BACKS_CACHE: list[str] | None = None
+# QPixmapCache keys inserted per back filename, so edits can drop them
+_BACK_PIXMAP_KEYS: dict[str, set[str]] = {}
+# Created on first use, once a QApplication exists
+_watcher: QFileSystemWatcher | None = None
+
+
+def get_renderer(path: Path) -> QSvgRenderer:
+    """Return the shared renderer for an SVG file, reading it once.
+
+    GUI thread only; worker threads create their own renderers.
+    """
+    renderer = _RENDERER_CACHE.get(path)
+    if renderer is None:
+        renderer = QSvgRenderer(QByteArray(path.read_bytes()))
+        _RENDERER_CACHE[path] = renderer
+    return renderer
+
+
+def _device_pixel_ratio() -> float:
+    """Physical pixels per logical pixel on the application's screen."""
+    return QGuiApplication.instance().devicePixelRatio()
+
+
+def _render_image(
+    path: Path, width: int, height: int, dpr: float, renderer: QSvgRenderer | None = None
+) -> QImage:
+    """Render an SVG file into a transparent image of width x height logical pixels.
+
+    The image holds width*dpr x height*dpr device pixels, so it stays sharp
+    on HiDPI screens. Without a `renderer` the file is parsed here, which is
+    safe off the GUI thread.
+    """
+    image = QImage(round(width * dpr), round(height * dpr), QImage.Format_ARGB32_Premultiplied)
+    image.setDevicePixelRatio(dpr)
+    image.fill(Qt.transparent)
+    if renderer is None:
+        renderer = QSvgRenderer(str(path))
+    painter = QPainter(image)
+    # Logical coordinates; the painter scales them by the image's ratio
+    renderer.render(painter, QRectF(0, 0, width, height))
+    painter.end()
+    return image
+
+
+def _rasterize(path: Path, width: int, height: int) -> QPixmap:
+    """Render an SVG file into a transparent pixmap of the given logical size."""
+    dpr = _device_pixel_ratio()
+    key = (path, width, height, dpr)
+    with _IMAGE_LOCK:
+        image = _IMAGE_CACHE.pop(key, None)
+        _RASTERIZED_KEYS.add(key)
+    if image is None:
+        image = _render_image(path, width, height, dpr, get_renderer(path))
+    # fromImage keeps the image's device pixel ratio
+    return QPixmap.fromImage(image)
+
+
+class _RenderTask(QRunnable):
+    """Renders one SVG into _IMAGE_CACHE on a thread pool worker."""
+
+    def __init__(self, path: Path, width: int, height: int, dpr: float) -> None:
+        super().__init__()
+        self.path = path
+        self.width = width
+        self.height = height
+        self.dpr = dpr
+
+    def run(self) -> None:
+        image = _render_image(self.path, self.width, self.height, self.dpr)
+        key = (self.path, self.width, self.height, self.dpr)
+        with _IMAGE_LOCK:
+            if key not in _RASTERIZED_KEYS:
+                _IMAGE_CACHE[key] = image
+
+
+def preload_card_assets() -> None:
+    """Render all card faces and backs in the background, once per process.
+
+    Faces are rendered at CARD_SIZES and backs at BACK_SIZES. Call after
+    the QApplication exists. Pixmaps requested before a worker
+    finishes are simply rendered on the spot. See stop_preload().
+    """
+    global _preload_started
+    if _preload_started:
+        return
+    _preload_started = True
+
+    jobs = [(path, size) for size in CARD_SIZES for path in sorted(CARDS_DIR.glob("*.svg"))]
+    # Backs with a pre-rendered PNG thumbnail don't need the SVG
+    backs = [p for p in sorted(BACKS_DIR.glob("*.svg")) if not p.with_suffix(".png").exists()]
+    jobs += [(path, size) for size in BACK_SIZES for path in backs]
+
+    QCoreApplication.instance().aboutToQuit.connect(stop_preload)
+    dpr = _device_pixel_ratio()
+    pool = QThreadPool.globalInstance()
+    for path, (width, height) in jobs:
+        pool.start(_RenderTask(path, width, height, dpr))
+
+
+def stop_preload() -> None:
+    """Drop queued preload renders and wait for the running ones.
+
+    Workers use Qt's font database, so they must finish before the
+    QApplication is destroyed. Runs on aboutToQuit; call it as well when
+    startup fails before the event loop runs.
+    """
+    pool = QThreadPool.globalInstance()
+    pool.clear()
+    pool.waitForDone()
+
+
+def card_pixmap(filename: str, width: int = 80, height: int = 112) -> QPixmap:
+    """Return the card face `filename` rendered at width x height."""
+    key = (filename, width, height, _device_pixel_ratio())
+    pixmap = _PIXMAP_CACHE.get(key)
+    if pixmap is None:
+        pixmap = _rasterize(CARDS_DIR / filename, width, height)
+        _PIXMAP_CACHE[key] = pixmap
+    return pixmap
+
+
+def _load_back(filename: str, width: int, height: int) -> QPixmap:
+    """Load a card back, preferring the pre-rendered PNG thumbnail.
+
+    Thumbnails are written by tools/render_back_thumbs.py (re-run it after
+    editing a back SVG). The SVG is only rasterized when no PNG exists.
+    """
+    svg_path = BACKS_DIR / filename
+    png_path = svg_path.with_suffix(".png")
+    if png_path.exists():
+        dpr = _device_pixel_ratio()
+        pixmap = QPixmap(str(png_path)).scaled(
+            round(width * dpr), round(height * dpr), Qt.IgnoreAspectRatio, Qt.SmoothTransformation
+        )
+        pixmap.setDevicePixelRatio(dpr)
+        return pixmap
+    return _rasterize(svg_path, width, height)
+
+
+def get_back_pixmap(filename: str, width: int, height: int) -> QPixmap:
+    """Return the card back `filename` rendered at width x height."""
+    key = f"back:{filename}@{width}x{height}@{_device_pixel_ratio()}"
+    pixmap = QPixmap()
+    if not QPixmapCache.find(key, pixmap):
+        pixmap = _load_back(filename, width, height)
+        QPixmapCache.insert(key, pixmap)
+        _BACK_PIXMAP_KEYS.setdefault(filename, set()).add(key)
+    return pixmap
+
+
+def list_backs() -> list[str]:
+    """Return the sorted SVG filenames available in the backs folder.
+
+    The folder is scanned once and then watched; the listing and any cached
+    pixmaps are invalidated only when files are added, removed or edited.
+    """
+    global _BACKS_CACHE
+    if _BACKS_CACHE is None:
+        if not BACKS_DIR.exists():
+            return []
+        watcher = _ensure_watcher()
+        svg_files = sorted(BACKS_DIR.glob("*.svg"))
+        _BACKS_CACHE = [svg_file.name for svg_file in svg_files]
+
+        # Watch each back (and its thumbnail) so edits drop stale pixmaps
+        watched = set(watcher.files())
+        paths = [str(p) for p in svg_files + [f.with_suffix(".png") for f in svg_files]]
+        new_paths = [p for p in paths if p not in watched and Path(p).exists()]
+        if new_paths:
+            watcher.addPaths(new_paths)
+    return list(_BACKS_CACHE)
+
+
+def _ensure_watcher() -> QFileSystemWatcher:
+    global _watcher
+    if _watcher is None:
+        _watcher = QFileSystemWatcher([str(BACKS_DIR)])
+        _watcher.directoryChanged.connect(_on_backs_dir_changed)
+        _watcher.fileChanged.connect(_on_back_file_changed)
+    return _watcher
+
+
+def _forget_back(filename: str) -> None:
+    """Drop every cached pixmap of one card back."""
+    for key in _BACK_PIXMAP_KEYS.pop(filename, ()):
+        QPixmapCache.remove(key)
+    _RENDERER_CACHE.pop(BACKS_DIR / filename, None)
+
+
+def _on_backs_dir_changed(path: str) -> None:
+    """A back was added or removed: rescan lazily, drop vanished backs."""
+    global _BACKS_CACHE
+    _BACKS_CACHE = None
+    present = {svg_file.name for svg_file in BACKS_DIR.glob("*.svg")}
+    for filename in list(_BACK_PIXMAP_KEYS):
+        if filename not in present:
+            _forget_back(filename)
+
+
+def _on_back_file_changed(path: str) -> None:
+    """A back SVG or its thumbnail was edited: drop only that back."""
+    changed = Path(path)
+    _forget_back(changed.with_suffix(".svg").name)
+    # Editors often save by replacing the file, which ends the watch
+    if changed.exists() and _watcher is not None and path not in _watcher.files():
+        _watcher.addPath(path)
@@ -15,10 +15,11 @@ from PySide6.QtWidgets import (
     QColorDialog,
     QFrame,
 )
-from PySide6.QtSvgWidgets import QSvgWidget
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtGui import QColor
 
+from .asset_cache import get_back_pixmap, list_backs
+
 BACKS_DIR = Path(__file__).resolve().parent.parent / "assets" / "backs"
 
 
@@ -27,6 +28,9 @@ DEFAULT_TABLE_COLOR = "#0d5c2e"  # Dark green felt
 DEFAULT_PLAYER_NAME = "Player"
 DEFAULT_PLAYER_COLOR = "#2e8b57"  # Sea green
 
+# Color swatch stylesheet; only the color is substituted
+_SWATCH_SS = "background-color: {c}; border: 1px solid #333; border-radius: 4px;".format
+
 
 class GameSettingsDialog(QDialog):
     """Dialog for game settings like card back selection."""
@@ -51,8 +55,12 @@ class GameSettingsDialog(QDialog):
         self.table_color = table_color
         self.player_name = player_name
         self.player_color = player_color
+        # Originals, so Apply only emits what the user actually changed
+        self._orig_table_color = table_color
+        self._orig_player_name = player_name
+        self._orig_player_color = player_color
+        self._backs_loaded = False
         self._init_ui()
-        self._load_backs()
 
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -73,7 +81,7 @@ class GameSettingsDialog(QDialog):
         preview_label.setAlignment(Qt.AlignCenter)
         preview_layout.addWidget(preview_label)
 
-        self.preview_widget = QSvgWidget()
+        self.preview_widget = QLabel()
         self.preview_widget.setFixedSize(120, 168)
         preview_layout.addWidget(self.preview_widget, alignment=Qt.AlignCenter)
         preview_layout.addStretch()
@@ -87,9 +95,7 @@ class GameSettingsDialog(QDialog):
         
         self.table_color_preview = QFrame()
         self.table_color_preview.setFixedSize(60, 30)
-        self.table_color_preview.setStyleSheet(
-            f"background-color: {self.table_color}; border: 1px solid #333; border-radius: 4px;"
-        )
+        self.table_color_preview.setStyleSheet(_SWATCH_SS(c=self.table_color))
         table_layout.addWidget(self.table_color_preview)
         
         table_color_btn = QPushButton("Choose Color...")
@@ -117,9 +123,7 @@ class GameSettingsDialog(QDialog):
         
         self.player_color_preview = QFrame()
         self.player_color_preview.setFixedSize(60, 30)
-        self.player_color_preview.setStyleSheet(
-            f"background-color: {self.player_color}; border: 1px solid #333; border-radius: 4px;"
-        )
+        self.player_color_preview.setStyleSheet(_SWATCH_SS(c=self.player_color))
         color_layout.addWidget(self.player_color_preview)
         
         player_color_btn = QPushButton("Choose Color...")
@@ -153,19 +157,22 @@ class GameSettingsDialog(QDialog):
         
         layout.addLayout(btn_layout)
 
+    def showEvent(self, event) -> None:  # type: ignore[override]
+        super().showEvent(event)
+        # Scan the backs folder on first show, not at construction
+        if not self._backs_loaded:
+            self._load_backs()
+            self._backs_loaded = True
+
     def _load_backs(self) -> None:
         """Load available card back designs from the backs folder."""
-        if not BACKS_DIR.exists():
-            return
-
-        svg_files = sorted(BACKS_DIR.glob("*.svg"))
-        for svg_file in svg_files:
-            item = QListWidgetItem(svg_file.stem)
-            item.setData(Qt.UserRole, svg_file.name)
+        for filename in list_backs():
+            item = QListWidgetItem(Path(filename).stem)
+            item.setData(Qt.UserRole, filename)
             self.back_list.addItem(item)
             
             # Select current back
-            if svg_file.name == self.current_back:
+            if filename == self.current_back:
                 self.back_list.setCurrentItem(item)
 
         # If no item selected, select first
@@ -180,41 +187,40 @@ class GameSettingsDialog(QDialog):
         filename = current.data(Qt.UserRole)
         back_path = BACKS_DIR / filename
         if back_path.exists():
-            self.preview_widget.load(str(back_path))
+            self.preview_widget.setPixmap(get_back_pixmap(filename, 120, 168))
 
     def _pick_table_color(self) -> None:
         """Open color picker for table color."""
         color = QColorDialog.getColor(QColor(self.table_color), self, "Choose Table Color")
         if color.isValid():
             self.table_color = color.name()
-            self.table_color_preview.setStyleSheet(
-                f"background-color: {self.table_color}; border: 1px solid #333; border-radius: 4px;"
-            )
+            self.table_color_preview.setStyleSheet(_SWATCH_SS(c=self.table_color))
 
     def _pick_player_color(self) -> None:
         """Open color picker for player name color."""
         color = QColorDialog.getColor(QColor(self.player_color), self, "Choose Player Name Color")
         if color.isValid():
             self.player_color = color.name()
-            self.player_color_preview.setStyleSheet(
-                f"background-color: {self.player_color}; border: 1px solid #333; border-radius: 4px;"
-            )
+            self.player_color_preview.setStyleSheet(_SWATCH_SS(c=self.player_color))
 
     def _apply_settings(self) -> None:
         """Apply the selected settings."""
         # Card back
         current = self.back_list.currentItem()
-        if current:
-            filename = current.data(Qt.UserRole)
+        filename = current.data(Qt.UserRole) if current else None
+        if filename and filename != self.current_back:
             self.card_back_changed.emit(filename)
         
         # Table color
-        self.table_color_changed.emit(self.table_color)
+        if self.table_color != self._orig_table_color:
+            self.table_color_changed.emit(self.table_color)
         
         # Player name and color
         new_name = self.player_name_input.text().strip() or DEFAULT_PLAYER_NAME
-        self.player_name_changed.emit(new_name)
-        self.player_color_changed.emit(self.player_color)
+        if new_name != self._orig_player_name:
+            self.player_name_changed.emit(new_name)
+        if self.player_color != self._orig_player_color:
+            self.player_color_changed.emit(self.player_color)
         
         self.accept()
 
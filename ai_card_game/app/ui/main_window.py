@@ -1,4 +1,4 @@
-from datetime import datetime
+import time
 from pathlib import Path
 
 from PySide6.QtWidgets import (
@@ -8,6 +8,7 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QDockWidget,
     QTextEdit,
+    QPlainTextEdit,
     QSplitter,
     QLabel,
     QMenuBar,
@@ -16,17 +17,31 @@ from PySide6.QtWidgets import (
     QPushButton,
 )
 from PySide6.QtCore import Qt
-from PySide6.QtGui import QAction, QIcon
+from PySide6.QtGui import QAction, QIcon, QTextCursor
 
 from .blackjack_view import BlackjackView
 from .war_view import WarView
 from .poker_view import PokerView
+from .table_view import TableView
 from .settings_dialog import SettingsDialog
 from .statistics_dialog import StatisticsDialog
 from .game_settings_dialog import GameSettingsDialog
 
 ICONS_DIR = Path(__file__).resolve().parent.parent / "assets" / "icons"
 
+# Chat line template (only chat needs HTML for the name color)
+_CHAT_LINE = (
+    "<span style='color:#888'>[{time}]</span> "
+    "<b style='color:{color}'>{name}:</b> {msg}"
+).format
+
+
+def _hms() -> str:
+    """Current local time as HH:MM:SS without going through strftime."""
+    t = time.localtime()
+    return f"{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+
+
 class MainWindow(QMainWindow):
     """Main window: game area + right panel (console + chat)."""
 
@@ -38,6 +53,8 @@ class MainWindow(QMainWindow):
         # Player settings (defaults)
         self._player_name = "Player"
         self._player_color = "#2e8b57"
+        self._sender_style: dict[str, tuple[str, str]] = {}
+        self._rebuild_sender_style()
         
         # Current game view
         self._current_game = "blackjack"
@@ -59,7 +76,7 @@ class MainWindow(QMainWindow):
         right_layout = QVBoxLayout(right_panel)
 
         # Console log
-        self.console = QTextEdit(self)
+        self.console = QPlainTextEdit(self)
         self.console.setReadOnly(True)
         self.console.setPlaceholderText("System messages and game log...")
 
@@ -67,6 +84,8 @@ class MainWindow(QMainWindow):
         self.chat = QTextEdit(self)
         self.chat.setReadOnly(True)
         self.chat.setPlaceholderText("Chat with AI will appear here...")
+        # Reused for every chat line instead of a new cursor per append()
+        self._chat_cursor = QTextCursor(self.chat.document())
 
         # Chat input area
         chat_input_layout = QHBoxLayout()
@@ -78,10 +97,17 @@ class MainWindow(QMainWindow):
         chat_input_layout.addWidget(self.chat_input)
         chat_input_layout.addWidget(self.send_btn)
 
-        right_layout.addWidget(QLabel("Console", self))
-        right_layout.addWidget(self.console, stretch=2)
-        right_layout.addWidget(QLabel("Chat", self))
-        right_layout.addWidget(self.chat, stretch=3)
+        # Smaller document margins mean less layout work per paint
+        self.console.document().setDocumentMargin(2)
+        self.chat.document().setDocumentMargin(2)
+
+        # Console and chat share a splitter so only the moved pane relayouts
+        splitter = QSplitter(Qt.Vertical, right_panel)
+        splitter.addWidget(self._wrap_with_label("Console", self.console))
+        splitter.addWidget(self._wrap_with_label("Chat", self.chat))
+        splitter.setStretchFactor(0, 2)
+        splitter.setStretchFactor(1, 3)
+        right_layout.addWidget(splitter)
         right_layout.addLayout(chat_input_layout)
 
         # Put right panel into a dock widget so it can be resized
@@ -96,23 +122,42 @@ class MainWindow(QMainWindow):
         # Simple initial log message
         self.log_message("Application started.")
 
+    def _wrap_with_label(self, title: str, widget: QWidget) -> QWidget:
+        """Return a container showing `title` above `widget`."""
+        container = QWidget(self)
+        container_layout = QVBoxLayout(container)
+        container_layout.setContentsMargins(0, 0, 0, 0)
+        container_layout.addWidget(QLabel(title, container))
+        container_layout.addWidget(widget)
+        return container
+
     def log_message(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.console.append(f"<span style='color:#888'>[{timestamp}]</span> {message}")
+        self.console.appendPlainText(f"[{_hms()}] {message}")
+
+    def _rebuild_sender_style(self) -> None:
+        """Map known chat senders (lowercased) to (display name, color)."""
+        player_style = (self._player_name, self._player_color)
+        self._sender_style = {
+            "ai": ("AI", "#dc3545"),  # Red for AI
+            "player": player_style,
+            self._player_name.lower(): player_style,
+        }
 
     def append_chat(self, sender: str, message: str) -> None:
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        # Color names: Player uses custom color, AI=red
-        if sender.lower() == "player" or sender == self._player_name:
-            name_color = self._player_color
-            display_name = self._player_name
-        else:
-            name_color = "#dc3545"  # Red for AI
-            display_name = sender
-        self.chat.append(
-            f"<span style='color:#888'>[{timestamp}]</span> "
-            f"<b style='color:{name_color}'>{display_name}:</b> {message}"
+        # Color names: Player uses custom color, anyone else red
+        display_name, name_color = self._sender_style.get(sender.lower(), (sender, "#dc3545"))
+        # Follow new messages only if the player hasn't scrolled up to read
+        scroll_bar = self.chat.verticalScrollBar()
+        at_bottom = scroll_bar.value() == scroll_bar.maximum()
+        cursor = self._chat_cursor
+        cursor.movePosition(QTextCursor.End)
+        if not self.chat.document().isEmpty():
+            cursor.insertBlock()
+        cursor.insertHtml(
+            _CHAT_LINE(time=_hms(), color=name_color, name=display_name, msg=message)
         )
+        if at_bottom:
+            scroll_bar.setValue(scroll_bar.maximum())
 
     def _send_chat_message(self) -> None:
         """Send player message to AI and get response about the game."""
@@ -177,6 +222,10 @@ class MainWindow(QMainWindow):
         
         self._current_game = game
         
+        # The old view is deleted; its running comments must not reach the chat
+        if isinstance(self._game_view, TableView):
+            self._game_view.detach()
+
         # Create new game view
         if game == "blackjack":
             self._game_view = BlackjackView(self)
@@ -233,8 +282,10 @@ class MainWindow(QMainWindow):
         if self._game_view:
             self._game_view.set_player_name(name)
         self._player_name = name
+        self._rebuild_sender_style()
 
     def _on_player_color_changed(self, color: str) -> None:
         if self._game_view:
             self._game_view.set_player_color(color)
         self._player_color = color
+        self._rebuild_sender_style()
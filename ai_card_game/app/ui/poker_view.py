@@ -1,26 +1,22 @@
 """Texas Hold'em Poker UI view."""
 
-from pathlib import Path
-from typing import Callable, Optional
+from typing import Callable
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QSizePolicy, QFrame, QSpinBox
 )
-from PySide6.QtSvgWidgets import QSvgWidget
-from PySide6.QtGui import QColor, QPainter, QBrush, QRadialGradient
-from PySide6.QtCore import Qt
+from PySide6.QtGui import QColor, QPalette, QPixmap
+from PySide6.QtCore import QTimer, Qt, Slot
 
 from ..core.poker.controller import PokerController
 from ..core.cards import Card
 from ..ai.poker_agent import PokerAgent
 from ..db.database import save_game_result
+from .asset_cache import card_pixmap, get_back_pixmap, preload_card_assets
+from .table_view import TableView
 
 
-ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
-CARDS_DIR = ASSETS_DIR / "cards"
-BACKS_DIR = ASSETS_DIR / "backs"
-
 # Button styles
 BUTTON_STYLE = """
     QPushButton {
@@ -98,56 +94,61 @@ STATUS_STYLE = """
     }
 """
 
+# Player name color is set through the palette, see _update_player_label
+PLAYER_LABEL_STYLE = """
+    QLabel {
+        font-size: 16px;
+        font-weight: bold;
+        padding: 4px;
+    }
+"""
+
+PLACEHOLDER_STYLE = "background: rgba(0,0,0,0.2); border-radius: 6px; border: 2px dashed #555;"
 
-class CardWidget(QSvgWidget):
-    """Widget to display a single card."""
+
+class CardWidget(QLabel):
+    """Widget to display a single card from its pre-rendered pixmap."""
     
     def __init__(self, card: Card | None = None, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setFixedSize(80, 112)
         if card:
-            svg_path = CARDS_DIR / card.svg_filename
-            self.load(str(svg_path))
+            self.setPixmap(card_pixmap(card.svg_filename))
 
 
-class PokerView(QWidget):
+class PokerView(TableView):
     """Texas Hold'em Poker view."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.controller = PokerController()
         self.agent = PokerAgent()
-        self._logger: Optional[Callable[[str], None]] = None
-        self._chat_sink: Optional[Callable[[str, str], None]] = None
         self._card_back: str = "back.svg"
-        self._table_color: str = "#0d5c2e"
         self._player_name: str = "Player"
         self._player_color: str = "#2e8b57"
-
+        # Card face widgets keyed by svg filename, reused across refreshes
+        self._card_cache: dict[str, CardWidget] = {}
+        # Projection of the last rendered state, to skip no-op refreshes
+        self._last_refresh_key: tuple | None = None
+        # Cards shown by the last _update_cards, to skip layout churn
+        self._last_cards_key: tuple | None = None
+        # True while a chain of _ai_step calls is scheduled
+        self._ai_running = False
+
+        # No-op if the app already started it
+        preload_card_assets()
         self._init_ui()
         self._refresh()
 
-    def set_logger(self, logger: Callable[[str], None]) -> None:
-        self._logger = logger
-
     def set_chat_sink(self, sink: Callable[[str, str], None]) -> None:
         self._chat_sink = sink
         if self._chat_sink:
             # Get LLM greeting
-            greeting = self.agent.get_comment(self.controller.state, "game_start")
-            self._chat_sink("AI", greeting)
+            self._request_comment("game_start")
             # If AI acts first, trigger AI turn
             if self.controller.state.turn == "ai":
                 self._ai_turn()
 
-    def _log(self, message: str) -> None:
-        if self._logger:
-            self._logger(message)
-
-    def _chat(self, sender: str, message: str) -> None:
-        if self._chat_sink:
-            self._chat_sink(sender, message)
-
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
@@ -177,6 +178,14 @@ class PokerView(QWidget):
         self.ai_cards_layout.setSpacing(5)
         self.ai_cards_layout.setAlignment(Qt.AlignCenter)
 
+        # Face-down AI hole cards; set_card_back swaps their pixmaps
+        self._back_widgets: list[CardWidget] = []
+        for _ in range(2):
+            back_widget = CardWidget(parent=self.ai_cards_widget)
+            back_widget.setPixmap(get_back_pixmap(self._card_back, 80, 112))
+            back_widget.hide()
+            self._back_widgets.append(back_widget)
+
         ai_section.addLayout(ai_info)
         ai_section.addWidget(self.ai_cards_widget)
         layout.addLayout(ai_section, stretch=1)
@@ -195,6 +204,15 @@ class PokerView(QWidget):
         self.community_layout.setSpacing(8)
         self.community_layout.setAlignment(Qt.AlignCenter)
 
+        # Placeholders for community cards not dealt yet, reused every refresh
+        self._community_placeholders: list[QFrame] = []
+        for _ in range(5):
+            placeholder = QFrame(self.community_widget)
+            placeholder.setFixedSize(80, 112)
+            placeholder.setStyleSheet(PLACEHOLDER_STYLE)
+            placeholder.hide()
+            self._community_placeholders.append(placeholder)
+
         self.phase_label = QLabel("Pre-Flop", self)
         self.phase_label.setStyleSheet(STATUS_STYLE)
         self.phase_label.setAlignment(Qt.AlignCenter)
@@ -219,6 +237,7 @@ class PokerView(QWidget):
         player_info = QHBoxLayout()
         self.player_label = QLabel(self._player_name.upper(), self)
         self.player_label.setAttribute(Qt.WA_TranslucentBackground)
+        self.player_label.setStyleSheet(PLAYER_LABEL_STYLE)
         self._update_player_label()
         self.player_chips_label = QLabel("$1000", self)
         self.player_chips_label.setStyleSheet(CHIPS_STYLE)
@@ -265,11 +284,13 @@ class PokerView(QWidget):
             btn.setCursor(Qt.PointingHandCursor)
         self.fold_btn.setCursor(Qt.PointingHandCursor)
 
-        self.fold_btn.clicked.connect(lambda: self._player_action("fold"))
-        self.check_btn.clicked.connect(lambda: self._player_action("check"))
-        self.call_btn.clicked.connect(lambda: self._player_action("call"))
-        self.raise_btn.clicked.connect(lambda: self._player_action("raise", self.raise_spin.value()))
-        self.allin_btn.clicked.connect(lambda: self._player_action("all_in"))
+        self.fold_btn.setProperty("action", "fold")
+        self.check_btn.setProperty("action", "check")
+        self.call_btn.setProperty("action", "call")
+        self.raise_btn.setProperty("action", "raise")
+        self.allin_btn.setProperty("action", "all_in")
+        for btn in [self.fold_btn, self.check_btn, self.call_btn, self.raise_btn, self.allin_btn]:
+            btn.clicked.connect(self._on_action_btn)
 
         btn_row.addWidget(self.fold_btn)
         btn_row.addWidget(self.check_btn)
@@ -294,37 +315,59 @@ class PokerView(QWidget):
     def _refresh(self) -> None:
         """Update UI to reflect current game state."""
         state = self.controller.state
-
-        # Update chip counts
-        self.player_chips_label.setText(f"${state.player_chips}")
-        self.ai_chips_label.setText(f"${state.ai_chips}")
-        self.pot_label.setText(f"Pot: ${state.pot}")
-
-        # Update phase
-        phase_names = {
-            "preflop": "Pre-Flop",
-            "flop": "Flop",
-            "turn": "Turn",
-            "river": "River",
-            "showdown": "Showdown"
-        }
-        phase_text = phase_names.get(state.phase, state.phase.title())
+        cards = (
+            tuple(c.svg_filename for c in state.player_hand),
+            tuple(c.svg_filename for c in state.ai_hand),
+            tuple(c.svg_filename for c in state.community_cards),
+        )
+        key = (
+            state.player_chips, state.ai_chips, state.pot, state.phase,
+            state.finished, state.winner, state.winning_hand, state.turn,
+            cards, self.controller.can_check(), self.controller.call_amount(),
+        )
+        if key == self._last_refresh_key:
+            return
+        self._last_refresh_key = key
+
+        # Coalesce label, layout and button changes into a single repaint
+        self.setUpdatesEnabled(False)
+        try:
+            # Update chip counts
+            self.player_chips_label.setText(f"${state.player_chips}")
+            self.ai_chips_label.setText(f"${state.ai_chips}")
+            self.pot_label.setText(f"Pot: ${state.pot}")
+
+            # Update phase
+            phase_names = {
+                "preflop": "Pre-Flop",
+                "flop": "Flop",
+                "turn": "Turn",
+                "river": "River",
+                "showdown": "Showdown"
+            }
+            phase_text = phase_names.get(state.phase, state.phase.title())
         
-        if state.finished:
-            if state.winner == "player":
-                phase_text = f"🎉 YOU WIN! ({state.winning_hand or ''})"
-            elif state.winner == "ai":
-                phase_text = f"💔 AI WINS! ({state.winning_hand or ''})"
-            else:
-                phase_text = f"🤝 TIE! ({state.winning_hand or ''})"
+            if state.finished:
+                if state.winner == "player":
+                    phase_text = f"🎉 YOU WIN! ({state.winning_hand or ''})"
+                elif state.winner == "ai":
+                    phase_text = f"💔 AI WINS! ({state.winning_hand or ''})"
+                else:
+                    phase_text = f"🤝 TIE! ({state.winning_hand or ''})"
         
-        self.phase_label.setText(phase_text)
+            self.phase_label.setText(phase_text)
 
-        # Update cards
-        self._update_cards()
+            # Update cards, only when a card was dealt or revealed
+            cards_key = (cards, state.phase == "showdown" or state.finished)
+            if cards_key != self._last_cards_key:
+                self._update_cards()
+                self._last_cards_key = cards_key
 
-        # Update buttons
-        self._update_buttons()
+            # Update buttons
+            self._update_buttons()
+        finally:
+            # Re-enabling updates schedules the repaint
+            self.setUpdatesEnabled(True)
 
     def _update_cards(self) -> None:
         """Update card displays."""
@@ -337,28 +380,25 @@ class PokerView(QWidget):
 
         # Player cards (always visible)
         for card in state.player_hand:
-            self.player_cards_layout.addWidget(CardWidget(card, self))
+            self._show_card(self.player_cards_layout, card.svg_filename, card_pixmap(card.svg_filename))
 
         # AI cards (hidden until showdown)
-        for card in state.ai_hand:
+        for i, card in enumerate(state.ai_hand):
             if state.phase == "showdown" or state.finished:
-                self.ai_cards_layout.addWidget(CardWidget(card, self))
+                self._show_card(self.ai_cards_layout, card.svg_filename, card_pixmap(card.svg_filename))
             else:
-                back_widget = QSvgWidget(self)
-                back_widget.setFixedSize(80, 112)
-                back_widget.load(str(BACKS_DIR / self._card_back))
+                back_widget = self._back_widgets[i]
                 self.ai_cards_layout.addWidget(back_widget)
+                back_widget.show()
 
         # Community cards
         for card in state.community_cards:
-            self.community_layout.addWidget(CardWidget(card, self))
+            self._show_card(self.community_layout, card.svg_filename, card_pixmap(card.svg_filename))
 
         # Placeholder for missing community cards
-        for _ in range(5 - len(state.community_cards)):
-            placeholder = QFrame(self)
-            placeholder.setFixedSize(80, 112)
-            placeholder.setStyleSheet("background: rgba(0,0,0,0.2); border-radius: 6px; border: 2px dashed #555;")
+        for placeholder in self._community_placeholders[: 5 - len(state.community_cards)]:
             self.community_layout.addWidget(placeholder)
+            placeholder.show()
 
     def _update_buttons(self) -> None:
         """Update button states."""
@@ -375,12 +415,34 @@ class PokerView(QWidget):
         call_amt = self.controller.call_amount()
         self.call_btn.setText(f"CALL ${call_amt}" if call_amt > 0 else "CALL")
 
+    def _get_card_widget(self, key: str, pixmap: QPixmap) -> CardWidget:
+        """Return the cached card widget for `key`, creating it once."""
+        widget = self._card_cache.get(key)
+        if widget is None:
+            widget = CardWidget(parent=self)
+            widget.setPixmap(pixmap)
+            self._card_cache[key] = widget
+        return widget
+
+    def _show_card(self, layout, key: str, pixmap: QPixmap) -> None:
+        widget = self._get_card_widget(key, pixmap)
+        layout.addWidget(widget)
+        widget.show()
+
     def _clear_layout(self, layout) -> None:
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
+        # Card widgets and placeholders are pooled; detach and hide them.
+        # Taking from the end avoids shifting the remaining items each time.
+        for i in range(layout.count() - 1, -1, -1):
+            widget = layout.takeAt(i).widget()
+            if widget is not None:
+                widget.hide()
+
+    @Slot()
+    def _on_action_btn(self) -> None:
+        """Dispatch an action button click using its "action" property."""
+        action = self.sender().property("action")
+        amount = self.raise_spin.value() if action == "raise" else 0
+        self._player_action(action, amount)
 
     def _player_action(self, action: str, amount: int = 0) -> None:
         """Handle player action."""
@@ -389,11 +451,11 @@ class PokerView(QWidget):
         
         # AI comment using LLM
         if action == "fold":
-            self._chat("AI", self.agent.get_comment(self.controller.state, "player_fold"))
+            self._request_comment("player_fold")
         elif action == "raise" or action == "all_in":
-            self._chat("AI", self.agent.get_comment(self.controller.state, "player_raise"))
+            self._request_comment("player_raise")
         elif action == "call":
-            self._chat("AI", self.agent.get_comment(self.controller.state, "player_call"))
+            self._request_comment("player_call")
         
         self._refresh()
         
@@ -403,38 +465,55 @@ class PokerView(QWidget):
 
     def _ai_turn(self) -> None:
         """Handle AI turn - LLM decides the action."""
-        while self.controller.state.turn == "ai" and not self.controller.state.finished:
-            # Get LLM decision
-            call_amount = self.controller.get_ai_call_amount()
-            decision = self.agent.decide_action(self.controller.state, call_amount)
+        if self._ai_running:
+            return
+        self._ai_running = True
+        self._ai_step()
+
+    def _ai_step(self) -> None:
+        """Run one AI action, then yield to the event loop before the next."""
+        try:
+            if self.controller.state.turn == "ai" and not self.controller.state.finished:
+                # Get LLM decision
+                call_amount = self.controller.get_ai_call_amount()
+                decision = self.agent.decide_action(self.controller.state, call_amount)
             
-            # Execute the decision
-            action, message = self.controller.ai_action(decision)
+                # Execute the decision
+                action, message = self.controller.ai_action(decision)
             
-            if message:
-                self._log(message)
-                # Use the comment from LLM decision
-                comment = decision.get("comment", "")
-                if comment:
-                    self._chat("AI", comment)
+                if message:
+                    self._log(message)
+                    # Use the comment from LLM decision
+                    comment = decision.get("comment", "")
+                    if comment:
+                        self._chat("AI", comment)
             
-            self._refresh()
+                self._refresh()
             
-            # Comment on new phase
-            if self.controller.state.phase == "flop" and len(self.controller.state.community_cards) == 3:
-                self._chat("AI", self.agent.get_comment(self.controller.state, "flop"))
-            elif self.controller.state.phase == "turn" and len(self.controller.state.community_cards) == 4:
-                self._chat("AI", self.agent.get_comment(self.controller.state, "turn"))
-            elif self.controller.state.phase == "river" and len(self.controller.state.community_cards) == 5:
-                self._chat("AI", self.agent.get_comment(self.controller.state, "river"))
+                # Comment on new phase
+                if self.controller.state.phase == "flop" and len(self.controller.state.community_cards) == 3:
+                    self._request_comment("flop")
+                elif self.controller.state.phase == "turn" and len(self.controller.state.community_cards) == 4:
+                    self._request_comment("turn")
+                elif self.controller.state.phase == "river" and len(self.controller.state.community_cards) == 5:
+                    self._request_comment("river")
+
+                if self.controller.state.turn == "ai" and not self.controller.state.finished:
+                    QTimer.singleShot(0, self._ai_step)
+                    return
+        except Exception:
+            # Leave the AI free to retry (e.g. from NEW HAND) if the LLM failed
+            self._ai_running = False
+            raise
+        self._ai_running = False
         
         # Check for game end
         if self.controller.state.finished:
             if self.controller.state.winner == "player":
-                self._chat("AI", self.agent.get_comment(self.controller.state, "lose"))
+                self._request_comment("lose")
                 save_game_result("poker", "win", self.controller.state.player_chips, self.controller.state.ai_chips)
             elif self.controller.state.winner == "ai":
-                self._chat("AI", self.agent.get_comment(self.controller.state, "win"))
+                self._request_comment("win")
                 save_game_result("poker", "loss", self.controller.state.player_chips, self.controller.state.ai_chips)
             self._refresh()
 
@@ -447,7 +526,7 @@ class PokerView(QWidget):
         
         self.controller.new_game()
         self._log("New hand dealt.")
-        self._chat("AI", self.agent.get_comment(self.controller.state, "game_start"))
+        self._request_comment("game_start")
         self._refresh()
         
         # If AI acts first
@@ -456,6 +535,8 @@ class PokerView(QWidget):
 
     def ask_ai_chat(self, message: str) -> None:
         """Handle player chat."""
+        if self._chat_sink is None:
+            return
         self._chat("AI", self.agent.chat_response(self.controller.state, message))
 
     # --- Settings ---
@@ -465,14 +546,9 @@ class PokerView(QWidget):
 
     def set_card_back(self, filename: str) -> None:
         self._card_back = filename
-        self._refresh()
-
-    def get_table_color(self) -> str:
-        return self._table_color
-
-    def set_table_color(self, color: str) -> None:
-        self._table_color = color
-        self.update()
+        pixmap = get_back_pixmap(filename, 80, 112)
+        for back_widget in self._back_widgets:
+            back_widget.setPixmap(pixmap)
 
     def get_player_name(self) -> str:
         return self._player_name
@@ -490,34 +566,6 @@ class PokerView(QWidget):
 
     def _update_player_label(self) -> None:
         self.player_label.setText(self._player_name.upper())
-        self.player_label.setStyleSheet(f"""
-            QLabel {{
-                color: {self._player_color};
-                font-size: 16px;
-                font-weight: bold;
-                padding: 4px;
-            }}
-        """)
-
-    def paintEvent(self, event) -> None:
-        """Paint table background."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        base = QColor(self._table_color)
-        r, g, b = base.red(), base.green(), base.blue()
-        
-        light = QColor(min(r + 40, 255), min(g + 40, 255), min(b + 40, 255))
-        dark = QColor(max(r - 30, 0), max(g - 30, 0), max(b - 30, 0))
-        
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-        radius = max(self.width(), self.height())
-        
-        gradient = QRadialGradient(center_x, center_y, radius)
-        gradient.setColorAt(0, light)
-        gradient.setColorAt(0.5, base)
-        gradient.setColorAt(1, dark)
-        
-        painter.fillRect(self.rect(), QBrush(gradient))
-        painter.end()
+        palette = self.player_label.palette()
+        palette.setColor(QPalette.WindowText, QColor(self._player_color))
+        self.player_label.setPalette(palette)
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from PySide6.QtWidgets import (
     QDialog,
     QVBoxLayout,
@@ -15,6 +17,16 @@ from ..config import settings
 from ..ai.client import AIClient
 
 
+@lru_cache(maxsize=8)
+def _get_client(host: str, model: str) -> AIClient:
+    """Return a shared client per (host, model).
+
+    AIClient only holds its host and model and opens a fresh HTTP client
+    per request, so one instance can be used from several worker threads.
+    """
+    return AIClient(host=host, model=model)
+
+
 class TestConnectionWorker(QObject):
     """Worker to test AI connection in background."""
     success = Signal(str)
@@ -27,7 +39,7 @@ class TestConnectionWorker(QObject):
 
     def run(self) -> None:
         try:
-            client = AIClient(host=self.host, model=self.model)
+            client = _get_client(self.host, self.model)
             # Send a tiny test message
             resp = client.chat([{"role": "user", "content": "Say 'OK' if you can hear me."}])
             self.success.emit(f"Connection successful! Response: {resp.content[:100]}")
@@ -5,15 +5,87 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QLabel,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
+    QAbstractItemView,
+    QHeaderView,
     QPushButton,
     QGroupBox,
     QFrame,
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QBrush, QColor
 
-from ..db.database import get_statistics
+from ..db.database import get_statistics, get_recent_games
+
+# Result colors, shared by every row (match the summary labels)
+_WIN_BRUSH = QBrush(QColor(46, 139, 87))
+_LOSS_BRUSH = QBrush(QColor(220, 53, 69))
+
+
+class GameHistoryModel(QAbstractTableModel):
+    """Read-only table model over the game history, loaded page by page.
+
+    The first page is loaded up front; the view asks for more through
+    canFetchMore/fetchMore as the user scrolls down.
+    """
+
+    HEADERS = ["Date", "Game", "Result", "Your Score", "AI Score"]
+    PAGE_SIZE = 50
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+        self._rows = get_recent_games(limit=self.PAGE_SIZE)
+        self._has_more = len(self._rows) == self.PAGE_SIZE
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and self._has_more
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        if parent.isValid():
+            return
+        games = get_recent_games(limit=self.PAGE_SIZE, offset=len(self._rows))
+        self._has_more = len(games) == self.PAGE_SIZE
+        if not games:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(games) - 1)
+        self._rows.extend(games)
+        self.endInsertRows()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        game = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.DisplayRole:
+            if column == 0:
+                return game["created_at"][:10] if game["created_at"] else ""
+            if column == 1:
+                return game["game_type"]
+            if column == 2:
+                return game["result"].upper()
+            if column == 3:
+                return str(game["player_final_score"] or "")
+            if column == 4:
+                return str(game["ai_final_score"] or "")
+        elif role == Qt.ForegroundRole and column == 2:
+            if game["result"] == "win":
+                return _WIN_BRUSH
+            if game["result"] == "loss":
+                return _LOSS_BRUSH
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
 
 
 class StatisticsDialog(QDialog):
@@ -52,15 +124,13 @@ class StatisticsDialog(QDialog):
         layout.addWidget(summary_group)
 
         # Recent games table
-        history_group = QGroupBox("Recent Games")
+        history_group = QGroupBox("Game History")
         history_layout = QVBoxLayout(history_group)
 
-        self.table = QTableWidget()
-        self.table.setColumnCount(5)
-        self.table.setHorizontalHeaderLabels(["Date", "Game", "Result", "Your Score", "AI Score"])
+        self.table = QTableView()
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
-        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
 
         history_layout.addWidget(self.table)
         layout.addWidget(history_group)
@@ -83,22 +153,12 @@ class StatisticsDialog(QDialog):
         self.winrate_label.setText(f"Win Rate: {stats['win_rate']:.1f}%")
 
         # Populate table
-        self.table.setRowCount(len(stats["recent_games"]))
-        for row, game in enumerate(stats["recent_games"]):
-            # Format date
-            date_str = game["created_at"][:10] if game["created_at"] else ""
-            
-            self.table.setItem(row, 0, QTableWidgetItem(date_str))
-            self.table.setItem(row, 1, QTableWidgetItem(game["game_type"]))
-            
-            result_item = QTableWidgetItem(game["result"].upper())
-            if game["result"] == "win":
-                result_item.setForeground(Qt.green)
-            elif game["result"] == "loss":
-                result_item.setForeground(Qt.red)
-            self.table.setItem(row, 2, result_item)
-            
-            self.table.setItem(row, 3, QTableWidgetItem(str(game["player_final_score"] or "")))
-            self.table.setItem(row, 4, QTableWidgetItem(str(game["ai_final_score"] or "")))
-
-        self.table.resizeColumnsToContents()
+        self.table.setModel(GameHistoryModel(self))
+
+        # Narrow columns fit their contents, score columns share the rest
+        # (sections only exist once the model is set)
+        header = self.table.horizontalHeader()
+        for column in (0, 1, 2):
+            header.setSectionResizeMode(column, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(3, QHeaderView.Stretch)
+        header.setSectionResizeMode(4, QHeaderView.Stretch)
@@ -0,0 +1,195 @@
+"""Shared base for the card table views.
+
+TableView paints the radial-gradient felt from a cached pixmap and runs
+AI comments on worker threads, one request at a time.
+"""
+
+import copy
+from typing import Callable, Optional
+
+from PySide6.QtWidgets import QWidget
+from PySide6.QtGui import QColor, QPainter, QPixmap, QRadialGradient
+from PySide6.QtCore import QCoreApplication, QObject, QThread, Qt, Signal
+
+# Worker threads still running, kept alive until they finish. Module-level
+# because a thread can outlive the view that started it (Switch Game), and
+# a QThread destroyed while running aborts the process.
+_jobs: list[tuple[QThread, QObject]] = []
+_stop_connected = False
+
+
+def _stop_jobs() -> None:
+    """Quit and wait for every worker thread; runs on aboutToQuit."""
+    for thread, _ in _jobs:
+        thread.quit()
+    for thread, _ in _jobs:
+        thread.wait()
+    _jobs.clear()
+
+
+class CommentWorker(QObject):
+    """Worker for async AI comments."""
+    finished = Signal(str)
+
+    def __init__(self, agent, state, event: str) -> None:
+        super().__init__()
+        self.agent = agent
+        self.state = state
+        # Not "event": that would shadow QObject.event() and crash Qt
+        self.event_name = event
+
+    def run(self) -> None:
+        try:
+            comment = self.agent.get_comment(self.state, self.event_name)
+            self.finished.emit(comment)
+        except Exception:
+            self.finished.emit("")
+
+
+class TableView(QWidget):
+    """Base game view: felt background, console/chat sinks and AI comments.
+
+    Subclasses set `controller` (with a `state`) and `agent` (with
+    `get_comment(state, event)`).
+    """
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._logger: Optional[Callable[[str], None]] = None
+        self._chat_sink: Optional[Callable[[str, str], None]] = None
+        self._table_color: str = "#0d5c2e"
+        # Table background, re-rendered only on resize or color change
+        self._bg_cache: QPixmap | None = None
+        self._bg_key: tuple | None = None
+        self._update_table_colors()
+        # At most one comment request in flight; while it runs only the
+        # newest event waits for it, with the state it happened in
+        self._comment_running = False
+        self._pending_comment: tuple[str, object] | None = None
+
+    def set_logger(self, logger: Callable[[str], None]) -> None:
+        self._logger = logger
+
+    def _log(self, message: str) -> None:
+        if self._logger:
+            self._logger(message)
+
+    def _chat(self, sender: str, message: str) -> None:
+        if self._chat_sink:
+            self._chat_sink(sender, message)
+
+    def detach(self) -> None:
+        """Disconnect from the window before this view is replaced.
+
+        Comments still running finish into nothing instead of posting into
+        the next game's chat.
+        """
+        self._logger = None
+        self._chat_sink = None
+        self._pending_comment = None
+
+    # --- Background workers ---
+
+    def _start_worker(self, worker: QObject, on_finished: Callable[[str], None]) -> None:
+        """Run `worker` on its own QThread; `on_finished` gets its result."""
+        global _stop_connected
+        if not _stop_connected:
+            QCoreApplication.instance().aboutToQuit.connect(_stop_jobs)
+            _stop_connected = True
+
+        thread = QThread()
+        worker.moveToThread(thread)
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(on_finished)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(self._reap_jobs)
+
+        _jobs.append((thread, worker))
+        thread.start()
+
+    def _reap_jobs(self) -> None:
+        """Drop references to worker threads that have finished."""
+        # A slot on the view, not a plain function, so it runs on the GUI
+        # thread; threads left by deleted views are reaped here too
+        _jobs[:] = [job for job in _jobs if not job[0].isFinished()]
+
+    def _request_comment(self, event: str) -> None:
+        """Generate an AI comment on `event` in a background thread."""
+        # Nobody would see it, so don't pay for the LLM call
+        if self._chat_sink is None:
+            return
+        # Snapshot so the worker never reads state the game is mutating
+        state = copy.deepcopy(self.controller.state)
+        if self._comment_running:
+            self._pending_comment = (event, state)
+            return
+        self._start_comment(event, state)
+
+    def _start_comment(self, event: str, state) -> None:
+        self._comment_running = True
+        self._start_worker(CommentWorker(self.agent, state, event), self._on_comment)
+
+    def _on_comment(self, comment: str) -> None:
+        self._comment_running = False
+        if comment:
+            self._chat("AI", comment)
+        if self._pending_comment is not None:
+            event, state = self._pending_comment
+            self._pending_comment = None
+            self._start_comment(event, state)
+
+    # --- Table felt ---
+
+    def get_table_color(self) -> str:
+        return self._table_color
+
+    def set_table_color(self, color: str) -> None:
+        self._table_color = color
+        self._update_table_colors()
+        self._bg_cache = None
+        self.update()
+
+    def _update_table_colors(self) -> None:
+        """Derive the felt gradient colors from the table color."""
+        base = QColor(self._table_color)
+        r, g, b = base.red(), base.green(), base.blue()
+        self._color_base = base
+        self._color_light = QColor(min(r + 40, 255), min(g + 40, 255), min(b + 40, 255))
+        self._color_dark = QColor(max(r - 30, 0), max(g - 30, 0), max(b - 30, 0))
+
+    def resizeEvent(self, event) -> None:  # type: ignore[override]
+        super().resizeEvent(event)
+        self._bg_cache = None
+
+    def paintEvent(self, event) -> None:
+        """Paint table background."""
+        key = (self.width(), self.height(), self._table_color)
+        if self._bg_cache is None or key != self._bg_key:
+            self._bg_cache = self._render_background()
+            self._bg_key = key
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._bg_cache)
+        painter.end()
+
+    def _render_background(self) -> QPixmap:
+        """Render the radial-gradient table felt at the current size."""
+        pixmap = QPixmap(self.size())
+        painter = QPainter(pixmap)
+
+        center_x = self.width() / 2
+        center_y = self.height() / 2
+        radius = max(self.width(), self.height())
+
+        gradient = QRadialGradient(center_x, center_y, radius)
+        gradient.setColorAt(0, self._color_light)
+        gradient.setColorAt(0.5, self._color_base)
+        gradient.setColorAt(1, self._color_dark)
+
+        # Axis-aligned rect: no antialiasing or pen needed
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(gradient)
+        painter.drawRect(pixmap.rect())
+        painter.end()
+        return pixmap
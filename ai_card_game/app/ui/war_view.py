@@ -1,27 +1,23 @@
 """War card game UI view."""
 
-from pathlib import Path
-from typing import Callable, Optional
+import copy
+from typing import Callable
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
     QSizePolicy, QFrame
 )
-from PySide6.QtSvgWidgets import QSvgWidget
-from PySide6.QtGui import QColor, QPainter, QBrush, QRadialGradient
-from PySide6.QtCore import QThread, Signal, QObject, Qt
+from PySide6.QtCore import Signal, QObject, Qt
 
 from ..core.war.controller import WarController
 from ..core.war.rules import card_value
 from ..core.cards import Card
 from ..ai.war_agent import WarAgent
 from ..db.database import save_game_result
+from .asset_cache import card_pixmap, get_back_pixmap
+from .table_view import TableView
 
 
-ASSETS_DIR = Path(__file__).resolve().parent.parent / "assets"
-CARDS_DIR = ASSETS_DIR / "cards"
-BACKS_DIR = ASSETS_DIR / "backs"
-
 # Button style (green)
 BUTTON_STYLE = """
     QPushButton {
@@ -71,33 +67,29 @@ STATUS_STYLE = """
 """
 
 
-class CardWidget(QSvgWidget):
-    """Widget to display a single card."""
+# Status line per outcome: the game winner once finished, otherwise
+# "war" or the last battle result
+STATUS_TEXT = {
+    "player": "🎉 YOU WIN THE WAR!",
+    "ai": "💔 AI WINS THE WAR!",
+    "war": "⚔️ WAR! {pot} cards at stake!",
+    "player_wins": "You win this battle! ({player} vs {ai})",
+    "ai_wins": "AI wins this battle! ({player} vs {ai})",
+}
+DEFAULT_STATUS_TEXT = "Cards: You {player} - AI {ai}"
+
+
+class CardWidget(QLabel):
+    """Widget to display a single card from its shared pre-rendered pixmap."""
     
     def __init__(self, card: Card | None = None, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setFixedSize(100, 140)
         if card:
-            svg_path = CARDS_DIR / card.svg_filename
-            self.load(str(svg_path))
+            self.set_card(card)
 
-
-class CommentWorker(QObject):
-    """Worker for async AI comments."""
-    finished = Signal(str)
-    
-    def __init__(self, agent: WarAgent, state, event: str) -> None:
-        super().__init__()
-        self.agent = agent
-        self.state = state
-        self.event = event
-    
-    def run(self) -> None:
-        try:
-            comment = self.agent.get_comment(self.state, self.event)
-            self.finished.emit(comment)
-        except Exception:
-            self.finished.emit("")
+    def set_card(self, card: Card) -> None:
+        self.setPixmap(card_pixmap(card.svg_filename, 100, 140))
 
 
 class ChatWorker(QObject):
@@ -118,45 +110,32 @@ class ChatWorker(QObject):
             self.finished.emit("Focus on the game! 😏")
 
 
-class WarView(QWidget):
+class WarView(TableView):
     """War card game view."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.controller = WarController()
         self.agent = WarAgent()
-        self._logger: Optional[Callable[[str], None]] = None
-        self._chat_sink: Optional[Callable[[str, str], None]] = None
-        self._comment_thread: Optional[QThread] = None
-        self._comment_worker: Optional[CommentWorker] = None
-        self._chat_thread: Optional[QThread] = None
-        self._chat_worker: Optional[ChatWorker] = None
         self._card_back: str = "back.svg"
-        self._table_color: str = "#0d5c2e"
         self._player_name: str = "Player"
         self._player_color: str = "#2e8b57"
+        # Set once the finished game is recorded, so refreshes don't save it again
+        self._result_saved = False
+        # What the last refresh showed, so unchanged regions are skipped
+        self._last_refresh_key: tuple | None = None
+        self._last_piles_key: tuple | None = None
+        self._last_battle_key: tuple | None = None
 
         self._init_ui()
         self._refresh()
         # Note: AI comment will be triggered when chat_sink is connected
 
-    def set_logger(self, logger: Callable[[str], None]) -> None:
-        self._logger = logger
-
     def set_chat_sink(self, sink: Callable[[str, str], None]) -> None:
         self._chat_sink = sink
         # Get LLM greeting
         if self._chat_sink:
-            greeting = self.agent.get_comment(self.controller.state, "game_start")
-            self._chat_sink("AI", greeting)
-
-    def _log(self, message: str) -> None:
-        if self._logger:
-            self._logger(message)
-
-    def _chat(self, sender: str, message: str) -> None:
-        if self._chat_sink:
-            self._chat_sink(sender, message)
+            self._request_comment("game_start")
 
     def _init_ui(self) -> None:
         layout = QVBoxLayout(self)
@@ -183,9 +162,9 @@ class WarView(QWidget):
         self.ai_pile_widget = QWidget(self)
         self.ai_pile_widget.setAttribute(Qt.WA_TranslucentBackground)
         ai_pile_layout = QVBoxLayout(self.ai_pile_widget)
-        self.ai_pile_card = QSvgWidget(self)
+        self.ai_pile_card = QLabel(self)
         self.ai_pile_card.setFixedSize(100, 140)
-        self.ai_pile_card.load(str(BACKS_DIR / self._card_back))
+        self.ai_pile_card.setPixmap(get_back_pixmap(self._card_back, 100, 140))
         self.ai_pile_count = QLabel("26", self)
         self.ai_pile_count.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
         self.ai_pile_count.setAlignment(Qt.AlignCenter)
@@ -198,6 +177,9 @@ class WarView(QWidget):
         self.ai_battle_widget.setFixedSize(100, 140)
         self.ai_battle_layout = QVBoxLayout(self.ai_battle_widget)
         self.ai_battle_layout.setContentsMargins(0, 0, 0, 0)
+        self._ai_battle_card = CardWidget(parent=self.ai_battle_widget)
+        self._ai_battle_card.hide()
+        self.ai_battle_layout.addWidget(self._ai_battle_card)
 
         ai_cards_layout.addWidget(self.ai_pile_widget)
         ai_cards_layout.addWidget(self.ai_battle_widget)
@@ -227,14 +209,17 @@ class WarView(QWidget):
         self.player_battle_widget.setFixedSize(100, 140)
         self.player_battle_layout = QVBoxLayout(self.player_battle_widget)
         self.player_battle_layout.setContentsMargins(0, 0, 0, 0)
+        self._player_battle_card = CardWidget(parent=self.player_battle_widget)
+        self._player_battle_card.hide()
+        self.player_battle_layout.addWidget(self._player_battle_card)
 
         # Player pile (face down)
         self.player_pile_widget = QWidget(self)
         self.player_pile_widget.setAttribute(Qt.WA_TranslucentBackground)
         player_pile_layout = QVBoxLayout(self.player_pile_widget)
-        self.player_pile_card = QSvgWidget(self)
+        self.player_pile_card = QLabel(self)
         self.player_pile_card.setFixedSize(100, 140)
-        self.player_pile_card.load(str(BACKS_DIR / self._card_back))
+        self.player_pile_card.setPixmap(get_back_pixmap(self._card_back, 100, 140))
         self.player_pile_count = QLabel("26", self)
         self.player_pile_count.setStyleSheet("color: white; font-size: 16px; font-weight: bold;")
         self.player_pile_count.setAlignment(Qt.AlignCenter)
@@ -275,88 +260,85 @@ class WarView(QWidget):
     def _refresh(self) -> None:
         """Update the UI to reflect current game state."""
         state = self.controller.state
-
-        # Update pile counts
-        self.player_pile_count.setText(str(state.player_card_count))
-        self.ai_pile_count.setText(str(state.ai_card_count))
-
-        # Update pile visibility
-        if state.player_card_count == 0:
-            self.player_pile_card.hide()
-        else:
-            self.player_pile_card.show()
-            self.player_pile_card.load(str(BACKS_DIR / self._card_back))
-
-        if state.ai_card_count == 0:
-            self.ai_pile_card.hide()
-        else:
-            self.ai_pile_card.show()
-            self.ai_pile_card.load(str(BACKS_DIR / self._card_back))
-
-        # Clear battle areas
-        self._clear_layout(self.player_battle_layout)
-        self._clear_layout(self.ai_battle_layout)
+        # Each count is a len() behind a property; read them once
+        player_count = state.player_card_count
+        ai_count = state.ai_card_count
+        player_card = state.player_battle_cards[-1] if state.player_battle_cards else None
+        ai_card = state.ai_battle_cards[-1] if state.ai_battle_cards else None
+
+        key = (
+            player_count, ai_count, player_card, ai_card,
+            state.finished, state.winner, state.in_war, state.last_result, len(state.war_pot),
+        )
+        if key == self._last_refresh_key:
+            return
+        self._last_refresh_key = key
+
+        # Update pile counts and visibility
+        piles_key = (player_count, ai_count)
+        if piles_key != self._last_piles_key:
+            self.player_pile_count.setText(str(player_count))
+            self.ai_pile_count.setText(str(ai_count))
+            self.player_pile_card.setVisible(player_count > 0)
+            self.ai_pile_card.setVisible(ai_count > 0)
+            self._last_piles_key = piles_key
 
         # Show battle cards if any
-        if state.player_battle_cards:
-            card = state.player_battle_cards[-1]
-            card_widget = CardWidget(card, self)
-            self.player_battle_layout.addWidget(card_widget)
+        battle_key = (player_card, ai_card)
+        if battle_key != self._last_battle_key:
+            if player_card:
+                self._player_battle_card.set_card(player_card)
+                self._player_battle_card.show()
+            else:
+                self._player_battle_card.hide()
 
-        if state.ai_battle_cards:
-            card = state.ai_battle_cards[-1]
-            card_widget = CardWidget(card, self)
-            self.ai_battle_layout.addWidget(card_widget)
+            if ai_card:
+                self._ai_battle_card.set_card(ai_card)
+                self._ai_battle_card.show()
+            else:
+                self._ai_battle_card.hide()
+            self._last_battle_key = battle_key
 
         # Update status
         if state.finished:
             self.battle_btn.setEnabled(False)
-            if state.winner == "player":
-                self.status_label.setText("🎉 YOU WIN THE WAR!")
-                save_game_result("war", "win", state.player_card_count, state.ai_card_count)
-            else:
-                self.status_label.setText("💔 AI WINS THE WAR!")
-                save_game_result("war", "loss", state.player_card_count, state.ai_card_count)
+            status = "player" if state.winner == "player" else "ai"
+            if not self._result_saved:
+                result = "win" if status == "player" else "loss"
+                save_game_result("war", result, player_count, ai_count)
+                self._result_saved = True
         elif state.in_war:
-            self.status_label.setText(f"⚔️ WAR! {len(state.war_pot)} cards at stake!")
-        elif state.last_result == "player_wins":
-            self.status_label.setText(f"You win this battle! ({state.player_card_count} vs {state.ai_card_count})")
-        elif state.last_result == "ai_wins":
-            self.status_label.setText(f"AI wins this battle! ({state.player_card_count} vs {state.ai_card_count})")
+            status = "war"
         else:
-            self.status_label.setText(f"Cards: You {state.player_card_count} - AI {state.ai_card_count}")
-
-    def _clear_layout(self, layout) -> None:
-        while layout.count():
-            item = layout.takeAt(0)
-            widget = item.widget()
-            if widget:
-                widget.setParent(None)
+            status = state.last_result
+        self.status_label.setText(
+            STATUS_TEXT.get(status, DEFAULT_STATUS_TEXT).format(
+                player=player_count, ai=ai_count, pot=len(state.war_pot)
+            )
+        )
 
     def on_battle(self) -> None:
         """Play one battle round."""
         result = self.controller.play_round()
         self._log(f"Battle result: {result}")
         self._refresh()
-        self._get_ai_comment(result)
+        self._request_comment(result)
 
     def on_new_game(self) -> None:
         """Start a new game."""
         self.controller.new_game()
+        self._result_saved = False
         self.battle_btn.setEnabled(True)
         self._log("New War game started.")
         self._refresh()
-        self._get_ai_comment("game_start")
-
-    def _get_ai_comment(self, event: str) -> None:
-        """Get AI comment using LLM."""
-        comment = self.agent.get_comment(self.controller.state, event)
-        if comment:
-            self._chat("AI", comment)
+        self._request_comment("game_start")
 
     def ask_ai_chat(self, message: str) -> None:
-        """Handle player chat message using LLM."""
-        response = self.agent.chat_response(self.controller.state, message)
+        """Handle player chat message using LLM in a background thread."""
+        worker = ChatWorker(self.agent, copy.deepcopy(self.controller.state), message)
+        self._start_worker(worker, self._on_chat_response)
+
+    def _on_chat_response(self, response: str) -> None:
         self._chat("AI", response)
 
     # --- Settings ---
@@ -365,15 +347,13 @@ class WarView(QWidget):
         return self._card_back
 
     def set_card_back(self, filename: str) -> None:
+        if filename == self._card_back:
+            return
         self._card_back = filename
-        self._refresh()
-
-    def get_table_color(self) -> str:
-        return self._table_color
-
-    def set_table_color(self, color: str) -> None:
-        self._table_color = color
-        self.update()
+        # Only the pile artwork depends on the back; no full refresh needed
+        back_pixmap = get_back_pixmap(filename, 100, 140)
+        self.player_pile_card.setPixmap(back_pixmap)
+        self.ai_pile_card.setPixmap(back_pixmap)
 
     def get_player_name(self) -> str:
         return self._player_name
@@ -399,26 +379,3 @@ class WarView(QWidget):
                 padding: 8px;
             }}
         """)
-
-    def paintEvent(self, event) -> None:
-        """Paint the table background."""
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
-        
-        base = QColor(self._table_color)
-        r, g, b = base.red(), base.green(), base.blue()
-        
-        light = QColor(min(r + 40, 255), min(g + 40, 255), min(b + 40, 255))
-        dark = QColor(max(r - 30, 0), max(g - 30, 0), max(b - 30, 0))
-        
-        center_x = self.width() / 2
-        center_y = self.height() / 2
-        radius = max(self.width(), self.height())
-        
-        gradient = QRadialGradient(center_x, center_y, radius)
-        gradient.setColorAt(0, light)
-        gradient.setColorAt(0.5, base)
-        gradient.setColorAt(1, dark)
-        
-        painter.fillRect(self.rect(), QBrush(gradient))
-        painter.end()
@@ -1,9 +1,16 @@
-from typing import List, Optional
-from .cards import Card
+import random
+from typing import TYPE_CHECKING, List, Optional
+
+from .cards import Card, rank_array
+
+if TYPE_CHECKING:
+    import numpy as np
 
 class AIPlayer:
     """AI player that makes decisions in the card game."""
     
+    __slots__ = ('name', 'hand')
+    
     def __init__(self, name: str = "Computer"):
         self.name = name
         self.hand: List[Card] = []
@@ -20,14 +27,22 @@ class AIPlayer:
         if not self.hand:
             raise ValueError("No cards left to play")
         
-        # Simple strategy: play a random card
-        import random
-        card_index = random.randint(0, len(self.hand) - 1)
-        return self.hand.pop(card_index)
+        # Simple strategy: play a random card. Swap it to the end so the
+        # pop doesn't shift the rest of the hand (hand order doesn't matter)
+        hand = self.hand
+        i = random.randrange(len(hand))
+        last = len(hand) - 1
+        hand[i], hand[last] = hand[last], hand[i]
+        return hand.pop()
+    
+    @property
+    def hand_ranks(self) -> "np.ndarray":
+        """Ranks of the cards in hand as an int8 array, in hand order."""
+        return rank_array(self.hand)
     
     def has_cards(self) -> bool:
         """Check if the AI has any cards left."""
-        return len(self.hand) > 0
+        return bool(self.hand)
     
     def __str__(self) -> str:
         return f"{self.name} ({len(self.hand)} cards)"
@@ -1,22 +1,29 @@
 import random
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
 
-@dataclass
+if TYPE_CHECKING:
+    import numpy as np
+
+# Numeric rank of each card value, used for comparison
+_RANK_MAP = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7,
+             '8': 8, '9': 9, '10': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
+
+@dataclass(frozen=True, slots=True)
 class Card:
     """A playing card with a suit and value."""
     suit: str
     value: str
+    rank: int = field(init=False)
+    display: str = field(init=False, repr=False, compare=False)
     
-    @property
-    def rank(self) -> int:
-        """Get the numeric rank of the card for comparison."""
-        values = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7,
-                 '8': 8, '9': 9, '10': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
-        return values.get(self.value, 0)
+    def __post_init__(self) -> None:
+        # Computed once; rank comparisons are then plain attribute reads
+        object.__setattr__(self, 'rank', _RANK_MAP.get(self.value, 0))
+        object.__setattr__(self, 'display', f"{self.value} of {self.suit}")
     
     def __str__(self) -> str:
-        return f"{self.value} of {self.suit}"
+        return self.display
 
 class Deck:
     """A standard deck of 52 playing cards."""
@@ -24,7 +31,7 @@ class Deck:
     VALUES = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
     
     def __init__(self):
-        self.cards = [Card(suit, value) for suit in self.SUITS for value in self.VALUES]
+        self.cards = list(ALL_CARDS)
         self.shuffle()
     
     def shuffle(self) -> None:
@@ -39,5 +46,18 @@ class Deck:
         """Check if the deck is empty."""
         return len(self.cards) == 0
     
+    def to_rank_array(self) -> "np.ndarray":
+        """Get the ranks of the remaining cards as an int8 array (top card last)."""
+        return rank_array(self.cards)
+    
     def __len__(self) -> int:
         return len(self.cards)
+
+def rank_array(cards: Sequence[Card]) -> "np.ndarray":
+    """Convert cards into an int8 array of ranks for vectorized or jitted code."""
+    # Imported here so the interactive game doesn't need numpy to start
+    import numpy as np
+    return np.fromiter((card.rank for card in cards), dtype=np.int8, count=len(cards))
+
+# Cards are immutable, so every deck shares the same 52 instances
+ALL_CARDS: Tuple[Card, ...] = tuple(Card(suit, value) for suit in Deck.SUITS for value in Deck.VALUES)
@@ -2,12 +2,26 @@ from typing import List, Tuple, Optional, Dict, Any
 from .cards import Card, Deck
 from .ai import AIPlayer
 from colorama import Fore, Style, init
+import os
 import random
+import sys
 import time
 
 # Initialize colorama
 init()
 
+# Round output templates, colored once at import
+_ROUND_HEADER = f"{Fore.YELLOW}\n=== Round {{}} ==={Style.RESET_ALL}\nYour cards: {{}}\n{{}}'s cards: {{}}\n\n"
+_OUT_OF_CARDS = f"{Fore.RED}You've run out of cards!{Style.RESET_ALL}\n"
+_INVALID_CHOICE = f"{Fore.RED}Please enter a number between 1 and {{}}{Style.RESET_ALL}\n"
+_PLAYED = f"\n{Fore.GREEN}You played: {{}}{Style.RESET_ALL}\n{Fore.RED}{{}} played: {{}}{Style.RESET_ALL}\n"
+_PLAYER_WINS = f"{Fore.GREEN}You win this round!{Style.RESET_ALL}\n"
+_AI_WINS = f"{Fore.RED}{{}} wins this round!{Style.RESET_ALL}\n"
+_TIE = "It's a tie!\n"
+
+# Pause between rounds for readability; set CARD_GAME_NO_DELAY for benchmarks
+_ROUND_DELAY = 0.0 if os.environ.get("CARD_GAME_NO_DELAY") else 1.5
+
 class CardGame:
     """Main game class for the card game."""
     
@@ -20,12 +34,11 @@ class CardGame:
     
     def deal_cards(self) -> None:
         """Deal cards to the player and AI."""
-        # Split the deck between player and AI
-        while not self.deck.is_empty():
-            if card := self.deck.draw():
-                self.player_hand.append(card)
-            if card := self.deck.draw():
-                self.ai.add_card(card)
+        # Split the shuffled deck between player and AI, alternating cards
+        cards = self.deck.cards
+        self.player_hand = cards[0::2]
+        self.ai.hand = cards[1::2]
+        self.deck.cards = []
     
     def start_game(self) -> None:
         """Start a new game."""
@@ -40,56 +53,65 @@ class CardGame:
     def game_loop(self) -> None:
         """Main game loop."""
         round_num = 1
+        write = sys.stdout.write
         
         while not self.game_over:
-            print(f"{Fore.YELLOW}\n=== Round {round_num} ==={Style.RESET_ALL}")
-            print(f"Your cards: {len(self.player_hand)}")
-            print(f"{self.ai.name}'s cards: {len(self.ai.hand)}\n")
+            # Each round's output is collected and written in one call
+            lines = [_ROUND_HEADER.format(round_num, len(self.player_hand), self.ai.name, len(self.ai.hand))]
             
             # Player's turn
             if not self.player_hand:
-                print(f"{Fore.RED}You've run out of cards!{Style.RESET_ALL}")
+                lines.append(_OUT_OF_CARDS)
+                write("".join(lines))
+                sys.stdout.flush()
                 self.game_over = True
                 break
                 
-            print("Your cards:")
-            for i, card in enumerate(self.player_hand, 1):
-                print(f"{i}. {card}")
+            lines.append("Your cards:\n")
+            lines.extend(f"{i}. {card}\n" for i, card in enumerate(self.player_hand, 1))
+            write("".join(lines))
+            sys.stdout.flush()
             
             # Get player's card choice
+            n = len(self.player_hand)
+            prompt = f"\nChoose a card to play (1-{n}): "
             while True:
                 try:
-                    choice = input("\nChoose a card to play (1-{}): ".format(len(self.player_hand)))
-                    if not choice.isdigit() or not (1 <= int(choice) <= len(self.player_hand)):
-                        raise ValueError("Invalid choice")
-                    break
+                    choice = int(input(prompt).strip())
                 except ValueError:
-                    print(f"{Fore.RED}Please enter a number between 1 and {len(self.player_hand)}{Style.RESET_ALL}")
+                    pass
+                else:
+                    if 1 <= choice <= n:
+                        break
+                write(_INVALID_CHOICE.format(n))
             
-            player_card = self.player_hand.pop(int(choice) - 1)
+            player_card = self.player_hand.pop(choice - 1)
             
             # AI's turn
             ai_card = self.ai.play_card()
             
-            print(f"\n{Fore.GREEN}You played: {player_card}{Style.RESET_ALL}")
-            print(f"{Fore.RED}{self.ai.name} played: {ai_card}{Style.RESET_ALL}")
+            lines = [_PLAYED.format(player_card, self.ai.name, ai_card)]
             
             # Determine round winner
             if player_card.rank > ai_card.rank:
-                print(f"{Fore.GREEN}You win this round!{Style.RESET_ALL}")
+                lines.append(_PLAYER_WINS)
                 self.score["player"] += 1
             elif ai_card.rank > player_card.rank:
-                print(f"{Fore.RED}{self.ai.name} wins this round!{Style.RESET_ALL}")
+                lines.append(_AI_WINS.format(self.ai.name))
                 self.score["ai"] += 1
             else:
-                print("It's a tie!")
+                lines.append(_TIE)
+            
+            write("".join(lines))
+            sys.stdout.flush()
             
             # Check if game over
             if not self.player_hand or not self.ai.has_cards():
                 self.game_over = True
             
             round_num += 1
-            time.sleep(1.5)  # Pause for readability
+            if _ROUND_DELAY:
+                time.sleep(_ROUND_DELAY)
         
         self.end_game()
     
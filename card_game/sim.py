@@ -0,0 +1,77 @@
+import numpy as np
+from numba import njit
+
+# Capacity of each ring buffer: one player can hold the whole deck
+_DECK_SIZE = 52
+
+
+def simulate_war(player_ranks: np.ndarray, ai_ranks: np.ndarray, max_rounds: int = 10_000) -> int:
+    """
+    Play a whole game of War on two int8 rank arrays (top card first), e.g.
+    from cards.rank_array(hand) or AIPlayer.hand_ranks.
+    Returns 1 if the player wins, -1 if the AI wins, 0 if undecided
+    after max_rounds. Won cards go to the bottom of the pile in the
+    order they were played, so the result is deterministic.
+    """
+    return _simulate_war(player_ranks, ai_ranks, max_rounds)
+
+
+# The explicit signature compiles at import instead of on the first call,
+# and cache=True stores the machine code so later runs just load it
+@njit("int64(int8[:], int8[:], int64)", cache=True, nogil=True)
+def _simulate_war(player_ranks: np.ndarray, ai_ranks: np.ndarray, max_rounds: int) -> int:
+    # Each pile is a ring buffer: head index plus card count
+    player = np.empty(_DECK_SIZE, dtype=np.int8)
+    ai = np.empty(_DECK_SIZE, dtype=np.int8)
+    player_n = len(player_ranks)
+    ai_n = len(ai_ranks)
+    player[:player_n] = player_ranks
+    ai[:ai_n] = ai_ranks
+    player_head = 0
+    ai_head = 0
+
+    pot = np.empty(_DECK_SIZE, dtype=np.int8)
+    pot_n = 0
+
+    for _ in range(max_rounds):
+        if player_n == 0:
+            return -1
+        if ai_n == 0:
+            return 1
+
+        player_card = player[player_head]
+        player_head = (player_head + 1) % _DECK_SIZE
+        player_n -= 1
+        ai_card = ai[ai_head]
+        ai_head = (ai_head + 1) % _DECK_SIZE
+        ai_n -= 1
+
+        pot[pot_n] = player_card
+        pot[pot_n + 1] = ai_card
+        pot_n += 2
+
+        if player_card > ai_card:
+            for i in range(pot_n):
+                player[(player_head + player_n) % _DECK_SIZE] = pot[i]
+                player_n += 1
+            pot_n = 0
+        elif ai_card > player_card:
+            for i in range(pot_n):
+                ai[(ai_head + ai_n) % _DECK_SIZE] = pot[i]
+                ai_n += 1
+            pot_n = 0
+        else:
+            # War: each player adds 3 face-down cards to the pot (if they have them)
+            for _ in range(3):
+                if player_n:
+                    pot[pot_n] = player[player_head]
+                    player_head = (player_head + 1) % _DECK_SIZE
+                    player_n -= 1
+                    pot_n += 1
+                if ai_n:
+                    pot[pot_n] = ai[ai_head]
+                    ai_head = (ai_head + 1) % _DECK_SIZE
+                    ai_n -= 1
+                    pot_n += 1
+
+    return 0
@@ -0,0 +1,48 @@
+"""Pre-render card back thumbnails.
+
+For every SVG in ai_card_game/app/assets/backs this writes a PNG with the
+same stem next to it, at twice the settings preview size. The game loads
+these PNGs instead of rasterizing the SVG at runtime.
+
+Usage:
+    python tools/render_back_thumbs.py
+"""
+
+import sys
+from pathlib import Path
+
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QGuiApplication, QImage, QPainter
+from PySide6.QtSvg import QSvgRenderer
+
+BACKS_DIR = Path(__file__).resolve().parent.parent / "ai_card_game" / "app" / "assets" / "backs"
+
+# 2x the 120x168 preview in the game settings dialog
+THUMB_WIDTH = 240
+THUMB_HEIGHT = 336
+
+
+def render_thumb(svg_path: Path) -> Path:
+    """Render one SVG to '<stem>.png' next to it and return the PNG path."""
+    image = QImage(THUMB_WIDTH, THUMB_HEIGHT, QImage.Format_ARGB32_Premultiplied)
+    image.fill(Qt.transparent)
+    renderer = QSvgRenderer(str(svg_path))
+    painter = QPainter(image)
+    renderer.render(painter)
+    painter.end()
+
+    png_path = svg_path.with_suffix(".png")
+    if not image.save(str(png_path)):
+        raise RuntimeError(f"Could not write {png_path}")
+    return png_path
+
+
+def main() -> None:
+    app = QGuiApplication(sys.argv)  # noqa: F841 - needed for SVG text rendering
+    for svg_path in sorted(BACKS_DIR.glob("*.svg")):
+        png_path = render_thumb(svg_path)
+        print(f"{svg_path.name} -> {png_path.name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""Offscreen smoke check for the game views.
+
+Builds each view and connects a chat sink the way MainWindow does on
+Switch Game, then runs the Qt event loop until the AI's background
+comments arrive. The LLM is replaced by a canned agent, so no Ollama
+server is needed, and results go to a throwaway database.
+
+Usage:
+    python tools/smoke_views.py
+"""
+
+import gc
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from PySide6.QtWidgets import QApplication
+
+from ai_card_game.app.db import database
+from ai_card_game.app.ui import table_view
+from ai_card_game.app.ui.poker_view import PokerView
+from ai_card_game.app.ui.war_view import WarView
+
+TIMEOUT = 5.0
+MAX_WAR_BATTLES = 5000
+POKER_ACTIONS = 200
+
+
+class CannedAgent:
+    """Stands in for every game agent with fixed answers.
+
+    Comments take `delay` seconds, like a slow LLM, and the agent records
+    the most comment requests it ever served at once.
+    """
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def get_comment(self, state, event: str) -> str:
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return f"comment:{event}"
+
+    def chat_response(self, state, player_message: str) -> str:
+        return f"reply:{player_message}"
+
+    def decide_action(self, state, call_amount: int) -> dict:
+        action = "call" if call_amount else "check"
+        return {"action": action, "raise_amount": 0, "comment": ""}
+
+
+def pump_until(app: QApplication, done) -> bool:
+    """Process events until done() is true or TIMEOUT passes."""
+    deadline = time.monotonic() + TIMEOUT
+    while not done():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.01)
+    return True
+
+
+def check_view(app: QApplication, view_cls) -> None:
+    view = view_cls()
+    view.agent = CannedAgent()
+    messages: list[str] = []
+    view.set_chat_sink(lambda sender, message: messages.append(message))
+
+    if not pump_until(app, lambda: "comment:game_start" in messages):
+        raise SystemExit(f"{view_cls.__name__}: no game_start comment, got {messages}")
+    # Let the worker threads wind down before the view goes away
+    if not pump_until(app, lambda: not table_view._jobs):
+        raise SystemExit(f"{view_cls.__name__}: comment threads still running")
+    print(f"{view_cls.__name__}: ok ({len(messages)} chat messages)")
+
+
+def check_war_game(app: QApplication) -> None:
+    """Play one War game to the end; its result must be saved exactly once."""
+    random.seed(1)
+    view = WarView()
+    view.agent = agent = CannedAgent(delay=0.02)
+    view.set_chat_sink(lambda sender, message: None)
+    for _ in range(MAX_WAR_BATTLES):
+        if view.controller.state.finished:
+            break
+        view.on_battle()
+        app.processEvents()
+    else:
+        raise SystemExit("WarView: game did not finish")
+
+    if agent.max_active > 1:
+        raise SystemExit(f"WarView: {agent.max_active} comment requests ran at once")
+
+    # A forced re-render of the finished game must not save it again
+    view._last_refresh_key = None
+    view._refresh()
+    pump_until(app, lambda: not table_view._jobs)
+
+    saved = sum(1 for game in database.get_recent_games(limit=100) if game["game_type"] == "war")
+    if saved != 1:
+        raise SystemExit(f"WarView: finished game saved {saved} times")
+    print("WarView game: ok (one comment at a time, result saved once)")
+
+
+def check_poker_hands(app: QApplication) -> None:
+    """Play poker hands by checking and calling; comments must not pile up."""
+    random.seed(1)
+    view = PokerView()
+    view.agent = agent = CannedAgent(delay=0.02)
+    view.set_chat_sink(lambda sender, message: None)
+    for _ in range(POKER_ACTIONS):
+        state = view.controller.state
+        if state.finished:
+            view.on_new_game()
+        elif state.turn == "player":
+            view._player_action("check" if view.controller.can_check() else "call")
+        app.processEvents()
+    pump_until(app, lambda: not table_view._jobs)
+
+    if agent.max_active > 1:
+        raise SystemExit(f"PokerView: {agent.max_active} comment requests ran at once")
+    print("PokerView hands: ok (one comment at a time)")
+
+
+class UnreachableAgent(CannedAgent):
+    """Fails every decision the way AIClient does when Ollama is down."""
+
+    def decide_action(self, state, call_amount: int) -> dict:
+        raise RuntimeError("AI request failed: connection refused")
+
+
+def check_poker_ai_recovers(app: QApplication) -> None:
+    """A failed AI decision must not stop the AI from acting later."""
+    view = PokerView()
+    view.agent = UnreachableAgent()
+    try:
+        # NEW HAND runs the AI turn itself when the AI acts first
+        while view.controller.state.turn != "ai":
+            view.on_new_game()
+        view._ai_turn()
+    except RuntimeError:
+        pass
+    if view.controller.state.turn != "ai":
+        raise SystemExit("PokerView: the failing AI decision was never attempted")
+    view.agent = CannedAgent()
+    view._ai_turn()
+    if view.controller.state.turn == "ai":
+        raise SystemExit("PokerView: AI never acted again after a failed decision")
+    print("PokerView AI failure: ok (AI acts again)")
+
+
+def check_view_deleted_mid_comment(app: QApplication) -> None:
+    """Deleting a view (Switch Game) or quitting while a comment runs must not abort."""
+    view = WarView()
+    view.agent = CannedAgent(delay=0.5)
+    messages: list[str] = []
+    view.set_chat_sink(lambda sender, message: messages.append(message))
+    view.detach()
+    view.deleteLater()
+    del view
+    app.processEvents()
+    gc.collect()
+    if not table_view._jobs:
+        raise SystemExit("WarView: comment thread was not kept alive")
+    # What aboutToQuit runs
+    table_view._stop_jobs()
+    app.processEvents()
+    if messages:
+        raise SystemExit(f"WarView: detached view still chatted {messages}")
+    print("WarView deleted mid-comment: ok (thread waited for)")
+
+
+def main() -> None:
+    app = QApplication(sys.argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        database.DB_FILE = Path(tmp) / "smoke.db"
+        database.init_db()
+        check_view(app, PokerView)
+        check_poker_hands(app)
+        check_poker_ai_recovers(app)
+        check_view(app, WarView)
+        check_war_game(app)
+        check_view_deleted_mid_comment(app)
+
+
+if __name__ == "__main__":
+    main()